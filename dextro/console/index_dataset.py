@@ -1,5 +1,4 @@
 import argparse
-import polars as pl
 
 from pathlib import Path
 from dextro.enrichers import enricher_registry
@@ -67,7 +66,7 @@ def main(args: argparse.Namespace):
     enrichers = [enricher_registry[name]() for name in args.enrichers]
     loader = loader_registry[args.loader]()
     
-    index_df = index_dataset(
+    index_dataset(
         data_root=root,
         batch_size=args.batch_size,
         loader=loader,
@@ -75,9 +74,6 @@ def main(args: argparse.Namespace):
         glob=args.glob,
         enrichers=enrichers,
         progress_bar=not args.quiet,
+        categorical_columns=args.categorical_columns,
+        output_path=root / args.output_filename,
     )
-
-    for col in set(index_df.columns) & set(args.categorical_columns):
-        index_df = index_df.with_columns(pl.col(col).cast(pl.Categorical))
-
-    index_df.write_parquet(root / args.output_filename)
@@ -0,0 +1,167 @@
+import polars as pl
+import mmap
+import os
+import weakref
+from pathlib import Path
+
+from dextro.loaders import BaseLoader, default_loader
+from dextro.types import DatasetRecord
+
+
+def _close(mem_views: list, mem_maps: list, file_handles: list, file_descriptors: list):
+    # Views have to be released before the memory maps they refer to can be closed
+    for mem_view in mem_views:
+        mem_view.release()
+    for mem_map in mem_maps:
+        mem_map.close()
+    for file_handle in file_handles:
+        file_handle.close()
+    for fd in file_descriptors:
+        os.close(fd)
+
+
+class IndexedDataset:
+    """
+    Random access dataset for indexed datasets.
+
+    Records are read through memory maps of the dataset files or with positional reads.
+    This implementation does not depend on PyTorch, see `dextro.torch.IndexedDataset`
+    for a PyTorch compatible variant.
+
+    Args:
+        root: The root directory of the indexed dataset.
+        index_filename: The filename of the index file. Defaults to 'index.parquet'.
+        loader: The loader used to deserialize items from the dataset. Defaults to the JSON Lines loader.
+        index_filter: A filter in the form of a Polars expression to apply to the index. Defaults to None.
+        backend: How records are read from the dataset files. Defaults to 'mmap'.
+            'mmap' reads from memory maps without copying, which is fastest if the data is in the page cache.
+            'pread' reads each record with a single `os.pread` call (POSIX only), which avoids a page fault
+            per accessed page and can be faster for random access to data that is not cached.
+    """
+
+    BACKENDS = ("mmap", "pread")
+
+    def __init__(
+        self,
+        root: str | Path,
+        index_filename: str = "index.parquet",
+        loader: BaseLoader = default_loader,
+        index_filter=None,
+        backend: str = "mmap",
+    ):
+        if backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown backend {backend!r}, expected one of {self.BACKENDS}"
+            )
+
+        if backend == "pread" and not hasattr(os, "pread"):
+            raise ValueError("The 'pread' backend is not supported on this platform")
+
+        self.root = Path(root)
+        self.loader = loader
+        self.backend = backend
+
+        # Scanning lazily pushes the filter down into the Parquet reader
+        index = pl.scan_parquet(self.root / index_filename)
+
+        if index_filter is not None:
+            index = index.filter(index_filter)
+
+        self.index = index.collect().rechunk()
+
+        self.filenames = self.index["filename"].unique().to_list()
+
+        self.file_handles = {}
+        self.mem_maps = {}
+        self.mem_views = {}
+        self.file_descriptors = {}
+
+        if backend == "pread":
+            self.file_descriptors = {
+                filename: os.open(self.root / filename, os.O_RDONLY)
+                for filename in self.filenames
+            }
+        else:
+            self._open_mem_maps()
+
+        # Unlike an atexit hook, the finalizer does not keep the dataset alive,
+        # so files are closed as soon as the dataset is garbage collected
+        self._finalizer = weakref.finalize(
+            self,
+            _close,
+            [view for view in self.mem_views.values() if isinstance(view, memoryview)],
+            list(self.mem_maps.values()),
+            list(self.file_handles.values()),
+            list(self.file_descriptors.values()),
+        )
+
+    def _open_mem_maps(self):
+        self.file_handles = {
+            filename: (self.root / filename).open("r+b") for filename in self.filenames
+        }
+
+        self.mem_maps = {
+            filename: mmap.mmap(
+                self.file_handles[filename].fileno(), 0, access=mmap.ACCESS_READ
+            )
+            for filename in self.file_handles
+        }
+
+        # Slicing a memoryview does not copy, slicing a memory map does
+        if self.loader.supports_buffers:
+            self.mem_views = {
+                filename: memoryview(mem_map)
+                for filename, mem_map in self.mem_maps.items()
+            }
+        else:
+            self.mem_views = self.mem_maps
+
+    def cleanup(self):
+        """
+        Closes all files of the dataset. Called automatically when the dataset is garbage collected
+        or at interpreter exit, whichever happens first.
+        """
+        self._finalizer()
+
+    def _read(self, filename: str, start: int, end: int) -> bytes | memoryview:
+        if self.backend == "pread":
+            return os.pread(self.file_descriptors[filename], end - start, start)
+        return self.mem_views[filename][start:end]
+
+    def _load(self, filename: str, start: int, end: int) -> DatasetRecord:
+        buffer = self._read(filename, start, end)
+
+        if isinstance(buffer, memoryview):
+            # Release the slice even if loading fails, so the memory map can still be closed
+            with buffer:
+                return self.loader.load_item(buffer)
+
+        return self.loader.load_item(buffer)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, idx):
+        item_meta = self.index.row(idx, named=True)
+        item = self._load(item_meta["filename"], item_meta["start"], item_meta["end"])
+        return item
+
+    def __getitems__(self, indices: list[int]) -> list[DatasetRecord]:
+        """
+        Fetches multiple items at once. Used by PyTorch's DataLoader for batched fetching.
+
+        The index rows are gathered in a single operation and the items are read sorted
+        by file and offset to improve locality, while the result preserves the given order.
+        """
+        rows = self.index[indices]
+        filenames = rows["filename"].to_list()
+        starts = rows["start"].to_list()
+        ends = rows["end"].to_list()
+
+        load = self._load
+        items = [None] * len(filenames)
+
+        for i in sorted(range(len(filenames)), key=lambda i: (filenames[i], starts[i])):
+            items[i] = load(filenames[i], starts[i], ends[i])
+
+        return items
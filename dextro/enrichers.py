@@ -1,29 +1,59 @@
+import functools
 from abc import abstractmethod, ABC
-from typing import Iterator
-from dextro.types import FileItem
+from typing import ClassVar, Iterable, Iterator
+from dextro.types import Batch, FileItem
 
 
-class BaseEnricher(ABC):
+class _ColumnarEnricher(ABC):
+    # Whether the enricher accesses the deserialized item. If no enricher does,
+    # loaders may skip deserialization during indexing.
+    requires_data: ClassVar[bool] = True
+
+    @abstractmethod
+    def _enrich_items(self, items: list[FileItem]) -> Iterable[FileItem | None]:
+        pass
+
+    def enrich_columns(self, batch: Batch) -> Batch:
+        """
+        Enriches a columnar batch.
+
+        The default implementation converts the batch to items and applies `enrich_item` or
+        `enrich_batch`. Enrichers may override this method to operate on the columns directly.
+        """
+        items = self._enrich_items(batch.to_items())
+        return Batch.from_items(
+            batch.filename, [item for item in items if item is not None]
+        )
+
+
+class BaseEnricher(_ColumnarEnricher):
     @abstractmethod
     def enrich_item(self, item: FileItem) -> FileItem | None:
         pass
 
+    def _enrich_items(self, items: list[FileItem]) -> Iterable[FileItem | None]:
+        return [self.enrich_item(item) for item in items]
+
 
-class BaseBatchedEnricher(ABC):
+class BaseBatchedEnricher(_ColumnarEnricher):
     @abstractmethod
-    def enrich_batch(
-        self, items: list[FileItem]
-    ) -> Iterator[FileItem | None]:
+    def enrich_batch(self, items: list[FileItem]) -> Iterator[FileItem | None]:
         pass
 
+    def _enrich_items(self, items: list[FileItem]) -> Iterable[FileItem | None]:
+        return self.enrich_batch(items) or []
+
 
 Enricher = BaseEnricher | BaseBatchedEnricher
 
 
-class TextLength(BaseEnricher):
+class TextLength(BaseEnricher, BaseBatchedEnricher):
     """
     Enricher that adds the length of the text as 'meta_text_length' to the item.
 
+    Supports both per-item and batched processing. The indexer processes it in batches
+    if a batch size greater than 1 is configured.
+
     Args:
         text_key: The key of the text field in the serialized item. Defaults to 'text'.
     """
@@ -32,9 +62,76 @@ class TextLength(BaseEnricher):
         self.text_key = text_key
 
     def enrich_item(self, item: FileItem) -> FileItem:
-        item.add_info('text_length', len(item.data[self.text_key]))
+        item.add_info("text_length", len(item.data[self.text_key]))
+        return item
+
+    def enrich_batch(self, items: list[FileItem]) -> list[FileItem]:
+        text_key = self.text_key
+
+        for item in items:
+            item.add_info("text_length", len(item.data[text_key]))
+
+        return items
+
+    def enrich_columns(self, batch: Batch) -> Batch:
+        text_key = self.text_key
+        batch.add_info("text_length", [len(data[text_key]) for data in batch.data])
+        return batch
+
+
+class ByteLength(BaseEnricher, BaseBatchedEnricher):
+    """
+    Enricher that adds the length of the serialized item in bytes as 'meta_byte_length' to the item.
+
+    The length is derived from the record offsets, so the item content is not accessed.
+    """
+
+    requires_data = False
+
+    def enrich_item(self, item: FileItem) -> FileItem:
+        item.add_info("byte_length", item.meta.end - item.meta.start)
         return item
 
+    def enrich_batch(self, items: list[FileItem]) -> list[FileItem]:
+        for item in items:
+            item.add_info("byte_length", item.meta.end - item.meta.start)
+
+        return items
+
+    def enrich_columns(self, batch: Batch) -> Batch:
+        batch.add_info(
+            "byte_length", [end - start for start, end in zip(batch.starts, batch.ends)]
+        )
+        return batch
+
+
+@functools.lru_cache(maxsize=None)
+def _get_language_detector(languages: frozenset | None, low_accuracy_mode: bool):
+    """
+    Builds a language detector, cached per process.
+
+    Detectors can take up to ~1 GB of memory when all languages are loaded,
+    so enrichers with the same configuration share a single instance.
+    """
+    try:
+        from lingua import LanguageDetectorBuilder
+    except ImportError as e:
+        raise ImportError(
+            "Please install the lingua-language-detector to support language detection"
+        ) from e
+
+    builder = LanguageDetectorBuilder
+
+    if not languages:
+        builder = builder.from_all_languages()
+    else:
+        builder = builder.from_languages(*languages)
+
+    if low_accuracy_mode:
+        builder = builder.with_low_accuracy_mode()
+
+    return builder.build()
+
 
 class LanguageDetectionEnricher(BaseBatchedEnricher):
     """
@@ -57,13 +154,6 @@ class LanguageDetectionEnricher(BaseBatchedEnricher):
         low_accuracy_mode: bool = False,
         text_key: str = "text",
     ):
-        try:
-            from lingua import LanguageDetectorBuilder
-        except ImportError as e:
-            raise ImportError(
-                "Please install the lingua-language-detector to support language detection"
-            ) from e
-
         if isinstance(languages, str):
             languages = [languages]
 
@@ -72,46 +162,56 @@ class LanguageDetectionEnricher(BaseBatchedEnricher):
         self.low_accuracy_mode = low_accuracy_mode
         self.text_key = text_key
 
-        builder = LanguageDetectorBuilder
-
-        if not languages:
-            builder = builder.from_all_languages()
-        else:
-            builder = builder.from_languages(*languages)
+        self.detector = self._get_detector()
 
-        if low_accuracy_mode:
-            builder = builder.with_low_accuracy_mode()
+    def _get_detector(self):
+        languages = frozenset(self.languages) if self.languages else None
+        return _get_language_detector(languages, self.low_accuracy_mode)
 
-        self.detector = builder.build()
+    def __getstate__(self):
+        # The detector is shared per process and rebuilt from the cache after unpickling
+        state = self.__dict__.copy()
+        del state["detector"]
+        return state
 
-    def enrich_batch(
-        self, items: list[FileItem]
-    ) -> Iterator[FileItem | None]:
-        texts = [item.data[self.text_key] for item in items]
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.detector = self._get_detector()
 
+    def _detect(self, texts: list[str]) -> list[str | None]:
         if self.detect_multiple:
             results = self.detector.detect_multiple_languages_in_parallel_of(texts)
 
-            for result, item in zip(results, items):
-                langs = [res.language.iso_code_639_1.name for res in result]
+            return [
+                ",".join(sorted(res.language.iso_code_639_1.name for res in result))
+                or None
+                for result in results
+            ]
 
-                if langs:
-                    langs = ",".join(langs)
-                else:
-                    langs = None
+        return [
+            lang.iso_code_639_1.name if lang is not None else None
+            for lang in self.detector.detect_languages_in_parallel_of(texts)
+        ]
 
-                item.add_info("language", sorted(langs))
-        else:
-            langs = self.detector.detect_languages_in_parallel_of(texts)
+    def enrich_batch(self, items: list[FileItem]) -> Iterator[FileItem | None]:
+        texts = [item.data[self.text_key] for item in items]
 
-            for lang, item in zip(langs, items):
-                item.add_info("language", lang.iso_code_639_1.name)
+        for lang, item in zip(self._detect(texts), items):
+            item.add_info("language", lang)
 
         return items
 
+    def enrich_columns(self, batch: Batch) -> Batch:
+        text_key = self.text_key
+        batch.add_info(
+            "language", self._detect([data[text_key] for data in batch.data])
+        )
+        return batch
+
 
 enricher_registry = {
     "text_length": lambda: TextLength(),
+    "byte_length": lambda: ByteLength(),
     "detect_language": lambda: LanguageDetectionEnricher(),
     "detect_language_low_accuracy": lambda: LanguageDetectionEnricher(
         low_accuracy_mode=True
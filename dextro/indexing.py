@@ -1,20 +1,348 @@
-from itertools import islice
+import os
 import json
+import tempfile
 import warnings
-import polars as pl
 import multiprocessing as mp
+import polars as pl
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tqdm import tqdm
 from pathlib import Path
-from typing import Callable, Any, Iterator, Sequence
+from typing import Callable, Any, Iterable, Iterator, Sequence
 from dextro.enrichers import BaseEnricher, BaseBatchedEnricher, Enricher
-from dextro.types import DatasetRecord, FileItem, PathLike
+from dextro.types import Batch, DatasetRecord, PathLike
 from dextro.loaders import BaseLoader, default_loader
 
 EnricherFunction = Callable[[DatasetRecord], DatasetRecord]
 BatchedEnricherFunction = Callable[[list[DatasetRecord]], list[DatasetRecord]]
 
 
+class RecordBatchBuilder:
+    """
+    Accumulates index records column by column and emits them as Arrow record batches.
+
+    Records are appended column by column instead of as dictionaries, which avoids schema inference
+    and per-cell boxing when the index is converted to a DataFrame. Offsets and file ids are written into
+    preallocated NumPy buffers that are handed to Arrow without copying, metadata is kept in Python lists.
+
+    Args:
+        flush_size: Number of rows after which the builder is considered full. Defaults to 65536.
+        meta_prefix: Prefix of the columns holding enricher information. Defaults to 'meta_'.
+        categorical_columns: Columns to dictionary-encode at build time. Defaults to ['filename'].
+    """
+
+    def __init__(
+        self,
+        flush_size: int = 65_536,
+        meta_prefix: str = "meta_",
+        categorical_columns: Sequence[str] = ("filename",),
+    ):
+        self.flush_size = flush_size
+        self.meta_prefix = meta_prefix
+        self.categorical_columns = set(categorical_columns)
+        self._reset()
+
+    def _reset(self):
+        # Flushed record batches share memory with the buffers, so they are allocated anew
+        self.num_rows = 0
+        self.starts = np.empty(self.flush_size, dtype=np.int64)
+        self.ends = np.empty(self.flush_size, dtype=np.int64)
+        # Filenames are stored as ids assigned in `file_ids` (filename -> id), so the
+        # filename column is dictionary-encoded without hashing a string per record
+        self.filename_ids = np.empty(self.flush_size, dtype=np.int32)
+        self.file_ids = {}
+        self.meta = {}
+
+    def _reserve(self, num_rows: int):
+        capacity = len(self.starts)
+
+        if num_rows <= capacity:
+            return
+
+        # Only reached if a single batch exceeds `flush_size`, as indexers flush before
+        # appending a batch that would not fit. Grow geometrically, so that the number of
+        # reallocations is logarithmic
+        capacity = max(2 * capacity, num_rows)
+
+        for name in ("starts", "ends", "filename_ids"):
+            buffer = getattr(self, name)
+            grown = np.empty(capacity, dtype=buffer.dtype)
+            grown[: self.num_rows] = buffer[: self.num_rows]
+            setattr(self, name, grown)
+
+    def __len__(self):
+        return self.num_rows
+
+    @property
+    def is_full(self) -> bool:
+        return self.num_rows >= self.flush_size
+
+    def fits(self, num_rows: int) -> bool:
+        return self.num_rows + num_rows <= self.flush_size
+
+    def append_batch(self, batch: Batch):
+        num_rows = self.num_rows
+        batch_size = len(batch)
+        end = num_rows + batch_size
+
+        self._reserve(end)
+
+        self.starts[num_rows:end] = batch.starts
+        self.ends[num_rows:end] = batch.ends
+        self.filename_ids[num_rows:end] = self.file_ids.setdefault(
+            batch.filename, len(self.file_ids)
+        )
+        self.num_rows = end
+
+        for key, values in batch.meta.items():
+            column = self.meta.get(key)
+
+            if column is None:
+                column = self.meta[key] = [None] * num_rows
+
+            column.extend(values)
+
+        # Pad columns for which this batch did not provide values
+        for column in self.meta.values():
+            if len(column) == num_rows:
+                column.extend([None] * batch_size)
+
+    def _encode(self, name: str, array: pa.Array) -> pa.Array:
+        if name in self.categorical_columns and not pa.types.is_null(array.type):
+            return array.dictionary_encode()
+        return array
+
+    def _build_filenames(self) -> pa.Array:
+        filenames = pa.DictionaryArray.from_arrays(
+            pa.array(self.filename_ids[: self.num_rows]),
+            pa.array(list(self.file_ids), type=pa.string()),
+        )
+
+        if "filename" not in self.categorical_columns:
+            return filenames.dictionary_decode()
+
+        return filenames
+
+    def flush(self) -> pa.RecordBatch:
+        """
+        Converts the accumulated records into a record batch and resets the builder.
+
+        Returns:
+            An Arrow record batch with the columns 'start', 'end', 'filename' and
+            one 'meta_' prefixed column per key provided by the enrichers.
+        """
+        names = ["start", "end", "filename"]
+        arrays = [
+            pa.array(self.starts[: self.num_rows]),
+            pa.array(self.ends[: self.num_rows]),
+            self._build_filenames(),
+        ]
+
+        for key, values in self.meta.items():
+            name = self.meta_prefix + key
+            names.append(name)
+            arrays.append(self._encode(name, pa.array(values)))
+
+        self._reset()
+
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def concat_record_batches(batches: Sequence[pa.RecordBatch]) -> pa.Table:
+    """
+    Concatenates record batches into a single Arrow table.
+
+    Batches may differ in their metadata columns (e.g. if an enricher did not provide
+    a value for any record of a batch); missing columns are filled with nulls.
+    Columns with different numeric types are promoted to a common type.
+    """
+    if not batches:
+        return pa.Table.from_batches([RecordBatchBuilder().flush()])
+
+    return pa.concat_tables(
+        [pa.Table.from_batches([batch]) for batch in batches],
+        promote_options="permissive",
+    )
+
+
+def unify_schemas(schemas: Iterable[pa.Schema]) -> pa.Schema:
+    """
+    Unifies the schemas of record batches, e.g. to fill in the type of columns
+    that only contained nulls or that are missing in some of the batches, or to
+    promote columns that are integers in some and floats in other batches.
+    """
+    return pa.unify_schemas(list(schemas), promote_options="permissive")
+
+
+def conform_record_batch(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch:
+    """
+    Conforms a record batch to a given schema.
+
+    Columns missing in the batch are filled with nulls and all columns are cast to the types of the schema.
+
+    Raises:
+        ValueError: If the batch contains columns that are not part of the schema or
+            values for a column that is typed as null in the schema.
+    """
+    unknown_columns = set(batch.schema.names) - set(schema.names)
+
+    if unknown_columns:
+        raise ValueError(
+            f"Columns {sorted(unknown_columns)} are not part of the schema {schema.names}."
+        )
+
+    arrays = []
+
+    for field in schema:
+        if field.name not in batch.schema.names:
+            arrays.append(pa.nulls(batch.num_rows, field.type))
+            continue
+
+        column = batch.column(field.name)
+
+        # Casting to null would silently drop values
+        if pa.types.is_null(field.type) and column.null_count < len(column):
+            raise ValueError(
+                f"Column {field.name!r} has values, but is typed as null in the schema."
+            )
+
+        arrays.append(column.cast(field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class _PartitionedParquetWriter:
+    """
+    Writes record batches to Parquet part files in a directory.
+
+    A new part is started whenever a batch does not fit the schema of the current part,
+    so that batches never have to be held in memory for long.
+    """
+
+    def __init__(self, directory: Path, compression: str):
+        self.directory = directory
+        self.compression = compression
+        self.parts: list[tuple[Path, pa.Schema]] = []
+        self._writer = None
+
+    @property
+    def schema(self) -> pa.Schema | None:
+        return self.parts[-1][1] if self.parts else None
+
+    def _start_part(self, schema: pa.Schema):
+        self.close()
+        part_path = self.directory / f"part-{len(self.parts)}.parquet"
+        self._writer = pq.ParquetWriter(part_path, schema, compression=self.compression)
+        self.parts.append((part_path, schema))
+
+    def write_batch(self, batch: pa.RecordBatch):
+        if self._writer is None:
+            self._start_part(batch.schema)
+        else:
+            schema = unify_schemas([self.schema, batch.schema])
+
+            if not schema.equals(self.schema):
+                self._start_part(schema)
+
+        self._writer.write_batch(conform_record_batch(batch, self.schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def write_record_batches(
+    batches: Iterable[pa.RecordBatch],
+    path: PathLike,
+    compression: str = "zstd",
+    max_pending_batches: int = 16,
+):
+    """
+    Writes record batches to a Parquet file as they arrive.
+
+    The schema of the file is derived from the batches. Batches are held back until the type of every
+    column is known, i.e. until no column only contained nulls so far, but at most `max_pending_batches`.
+    If a later batch still adds columns or values for a column typed as null, the batches are written
+    to part files first and the parts are merged into the final file with the unified schema.
+
+    Args:
+        batches: The record batches to write.
+        path: The path of the Parquet file.
+        compression: The compression codec to use. Defaults to 'zstd'.
+        max_pending_batches: Maximum number of batches to hold back to determine the schema. Defaults to 16.
+    """
+    path = Path(path)
+    pending: list[pa.RecordBatch] = []
+    schema_fixed = False
+
+    with tempfile.TemporaryDirectory(
+        dir=path.parent, prefix=f".{path.name}."
+    ) as temp_dir:
+        writer = _PartitionedParquetWriter(Path(temp_dir), compression=compression)
+
+        try:
+            for batch in batches:
+                if schema_fixed:
+                    writer.write_batch(batch)
+                    continue
+
+                pending.append(batch)
+                schema = unify_schemas(
+                    pending_batch.schema for pending_batch in pending
+                )
+
+                if len(pending) >= max_pending_batches or not any(
+                    pa.types.is_null(field.type) for field in schema
+                ):
+                    for pending_batch in pending:
+                        writer.write_batch(conform_record_batch(pending_batch, schema))
+                    pending.clear()
+                    schema_fixed = True
+
+            if not schema_fixed:
+                pq.write_table(
+                    concat_record_batches(pending), path, compression=compression
+                )
+                return
+        finally:
+            writer.close()
+
+        if len(writer.parts) == 1:
+            os.replace(writer.parts[0][0], path)
+            return
+
+        schema = unify_schemas(part_schema for _, part_schema in writer.parts)
+
+        with pq.ParquetWriter(path, schema, compression=compression) as final_writer:
+            for part_path, _ in writer.parts:
+                with pq.ParquetFile(part_path) as part_file:
+                    for batch in part_file.iter_batches():
+                        final_writer.write_batch(conform_record_batch(batch, schema))
+
+
+def _limit_record_batches(
+    batches: Iterator[pa.RecordBatch], max_iter: int | None, progress_bar: bool
+) -> Iterator[pa.RecordBatch]:
+    num_records = 0
+
+    with tqdm(total=max_iter, unit=" records", disable=not progress_bar) as pbar:
+        for batch in batches:
+            if max_iter and num_records + batch.num_rows > max_iter:
+                batch = batch.slice(0, max_iter - num_records)
+
+            yield batch
+
+            num_records += batch.num_rows
+            pbar.update(batch.num_rows)
+
+            if max_iter and num_records >= max_iter:
+                break
+
+
 class FileIndexer:
     """
     Indexes records in a single file.
@@ -24,18 +352,25 @@ class FileIndexer:
         load_fn: A function to load the serialized item from the file. Defaults to json.loads.
         batch_size: Internal processing batch size. Higher values may improve the efficiency of batched enrichers. Defaults to 1.
         enrichers: Enrichers to use for indexing. By default, no enrichers will be used.
+        flush_size: Number of records per Arrow record batch. Defaults to 65536.
+        categorical_columns: Columns to dictionary-encode when building record batches. Defaults to ['filename'].
     """
 
-    KEEP_KEYS = ["filename", "start", "end", "text_length"]
+    KEEP_KEYS = ["filename", "start", "end"]
+    MIN_READ_SIZE = 1024
 
     def __init__(
         self,
         loader: BaseLoader = default_loader,
         batch_size: int = 1,
         enrichers: Enricher | Sequence[Enricher] | None = None,
+        flush_size: int = 65_536,
+        categorical_columns: Sequence[str] = ("filename",),
     ):
         self.loader = loader
         self.batch_size = batch_size
+        self.flush_size = flush_size
+        self.categorical_columns = categorical_columns
         self.enrichers = []
         self.batched_enrichers = []
 
@@ -45,14 +380,17 @@ class FileIndexer:
             enrichers = [enrichers]
 
         for enricher in enrichers:
-            if isinstance(enricher, Enricher):
-                if isinstance(enricher, BaseEnricher):
-                    self.enrichers.append(enricher)
-                if isinstance(enricher, BaseBatchedEnricher):
-                    self.batched_enrichers.append(enricher)
-            else:
+            if not isinstance(enricher, Enricher):
                 raise ValueError(f"Expected Enricher, got {enricher!r}")
 
+            # Enrichers supporting both modes are processed per item unless batching is enabled
+            if isinstance(enricher, BaseEnricher) and (
+                self.batch_size == 1 or not isinstance(enricher, BaseBatchedEnricher)
+            ):
+                self.enrichers.append(enricher)
+            else:
+                self.batched_enrichers.append(enricher)
+
         if self.batched_enrichers:
             if self.batch_size == 1:
                 warnings.warn(
@@ -60,26 +398,73 @@ class FileIndexer:
                     "This might lead to inefficient batched processing."
                 )
 
-    def _enrich_item(self, item: DatasetRecord):
-        for transform in self.enrichers:
-            item = transform.enrich_item(item)
-            if item is None:
-                break
-        return item
+        # Per-item enrichers run before batched ones. Bound methods are resolved once here
+        # rather than on every batch.
+        self._enrich_fns = tuple(
+            enricher.enrich_columns
+            for enricher in self.enrichers + self.batched_enrichers
+        )
+        self._needs_data = any(
+            enricher.requires_data
+            for enricher in self.enrichers + self.batched_enrichers
+        )
+
+    @property
+    def read_size(self) -> int:
+        """
+        Number of items read from the loader at once.
 
-    def _enrich_batch(self, batch: list[DatasetRecord]):
-        for transform in self.batched_enrichers:
-            batch = transform.enrich_batch(batch)
-            if batch is None:
-                break
-            batch = [item for item in batch if item is not None]
+        Equals the batch size if enrichers that only support batched processing are used, so that
+        they receive batches of the configured size. Otherwise, larger batches are read to reduce
+        the per-batch overhead.
+        """
+        if any(
+            not isinstance(enricher, BaseEnricher)
+            for enricher in self.batched_enrichers
+        ):
+            return self.batch_size
+        return max(self.batch_size, self.MIN_READ_SIZE)
+
+    def _enrich(self, batch: Batch) -> Batch:
+        for enrich_fn in self._enrich_fns:
+            batch = enrich_fn(batch)
             if not batch:
                 break
         return batch
-    
-    def _finish_batch(self, batch: list[FileItem]):
-        for item in batch:
-            yield item.meta.as_dict()
+
+    def _iter_enriched_batches(self, path: Path) -> Iterator[Batch]:
+        batches = self.loader.iter_file_batches(
+            path, self.read_size, decode=self._needs_data
+        )
+
+        if not self._enrich_fns:
+            yield from batches
+            return
+
+        enrich = self._enrich
+
+        for batch in batches:
+            batch = enrich(batch)
+
+            if batch:
+                yield batch
+
+    def _finish_batch(
+        self, batch: Batch, builder: RecordBatchBuilder
+    ) -> Iterator[pa.RecordBatch]:
+        # Flushing before a batch that would not fit keeps the preallocated buffers from being regrown
+        if len(builder) and not builder.fits(len(batch)):
+            yield builder.flush()
+
+        builder.append_batch(batch)
+
+        if builder.is_full:
+            yield builder.flush()
+
+    def create_builder(self) -> RecordBatchBuilder:
+        return RecordBatchBuilder(
+            flush_size=self.flush_size, categorical_columns=self.categorical_columns
+        )
 
     def __call__(self, path: PathLike) -> Iterator[DatasetRecord]:
         """
@@ -95,30 +480,50 @@ class FileIndexer:
 
         Yields:
             A dictionary representing a single record in the dataset.
-            The keys 'filename', 'start', 'end', and 'text_length' are always present while
-            additional keys prefixed with 'meta_' may be present depending on the enrichers used.
+            The keys 'filename', 'start', and 'end' are always present while additional keys
+            prefixed with 'meta_' may be present depending on the enrichers used.
+        """
+        for batch in self._iter_enriched_batches(Path(path)):
+            yield from batch.iter_records()
+
+    def iter_record_batches(
+        self, path: PathLike, builder: RecordBatchBuilder | None = None
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Indexes records in a single file and yields them as Arrow record batches.
+
+        Args:
+            path: The path to the file to index.
+            builder: The builder to accumulate records in. If provided, records remaining in the builder
+                after the last full batch are not flushed, so that the builder can be shared across files.
+                Defaults to None (a new builder is created and flushed at the end).
+
+        Yields:
+            Arrow record batches with up to `flush_size` records.
         """
-        path = Path(path)
+        owns_builder = builder is None
+
+        if owns_builder:
+            builder = self.create_builder()
 
-        batch = []
+        for batch in self._iter_enriched_batches(Path(path)):
+            yield from self._finish_batch(batch, builder)
 
-        for item in self.loader.iter_file_items(path):
-            item = self._enrich_item(item)
+        if owns_builder and len(builder):
+            yield builder.flush()
 
-            if not item:
-                continue
 
-            batch.append(item)
+# Indexer of the current worker process, set once per process by `_init_worker`
+_worker_indexer: FileIndexer | None = None
 
-            if len(batch) >= self.batch_size:
-                batch = self._enrich_batch(batch)
-                yield from self._finish_batch(batch)
 
-                batch = []
+def _init_worker(indexer: FileIndexer):
+    global _worker_indexer
+    _worker_indexer = indexer
 
-        if batch:
-            batch = self._enrich_batch(batch)
-            yield from self._finish_batch(batch)
+
+def _index_file(path: Path) -> list[pa.RecordBatch]:
+    return list(_worker_indexer.iter_record_batches(path))
 
 
 class DirectoryIndexer:
@@ -129,8 +534,14 @@ class DirectoryIndexer:
         indexer: The indexer to use for indexing individual files.
         glob: Glob patterns to match dataset chunk files. Defaults to ['*.jsonl', '*.json'].
         num_workers: The number of worker processes to use for indexing. Defaults to None (no parallelism).
-            It is recommended to not use parallelization at the moment as the overhead may lead
-            to a significant overhead and thus slower indexing than single-threaded processing.
+            Each worker indexes whole files and sends back their record batches, so that the
+            inter-process communication overhead is paid once per file rather than once per record.
+            Workers are spawned rather than forked, so scripts using worker processes have to guard
+            their entry point with `if __name__ == "__main__":`.
+        use_threads: Whether to use worker threads instead of worker processes. Defaults to False.
+            Threads share the indexer and its enrichers and don't need to pickle record batches, but
+            only scale for work that runs without the GIL, i.e. on free-threaded Python builds or with
+            enrichers releasing the GIL.
     """
 
     def __init__(
@@ -138,6 +549,7 @@ class DirectoryIndexer:
         indexer: FileIndexer,
         glob: str | list[str] = ("*.jsonl", "*.json"),
         num_workers: int | None = None,
+        use_threads: bool = False,
     ):
         if isinstance(glob, str):
             glob = [glob]
@@ -145,11 +557,41 @@ class DirectoryIndexer:
         self.indexer = indexer
         self.glob = glob
         self.num_workers = num_workers
+        self.use_threads = use_threads
+
+    def _find_paths(self, dataset_root: Path) -> list[Path]:
+        paths = sorted(
+            path for pattern in self.glob for path in dataset_root.glob(pattern)
+        )
 
-    def _collect_items(self, path, queue):
-        for item in self.indexer(path):
-            queue.put(item)
-        queue.put(None)
+        if not paths:
+            raise ValueError(
+                f"No files found matching glob patterns {self.glob!r} in {dataset_root}"
+            )
+
+        return paths
+
+    def _index_file(self, path: Path) -> list[pa.RecordBatch]:
+        return list(self.indexer.iter_record_batches(path))
+
+    def _iter_parallel(self, paths: list[Path]) -> Iterator[pa.RecordBatch]:
+        if self.use_threads:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                for batches in executor.map(self._index_file, paths):
+                    yield from batches
+            return
+
+        # Forked workers would inherit state of the parent such as cached language detectors
+        # including their internal thread pools, but not the threads, which can deadlock.
+        # Spawned workers build their state in the initializer instead.
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.indexer,),
+        ) as executor:
+            for batches in executor.map(_index_file, paths):
+                yield from batches
 
     def __call__(self, dataset_root: Path | str) -> Iterator[DatasetRecord]:
         """
@@ -164,43 +606,41 @@ class DirectoryIndexer:
 
         Yields:
             A dictionary representing a single record in the dataset.
-            The keys 'filename', 'start', 'end', and 'text_length' are always present while
-            additional keys prefixed with 'meta_' may be present depending on the enrichers used.
+            The keys 'filename', 'start', and 'end' are always present while additional keys
+            prefixed with 'meta_' may be present depending on the enrichers used.
         """
-        dataset_root = Path(dataset_root)
-
-        paths = sorted(path for pattern in self.glob for path in dataset_root.glob(pattern))
-
-        if not paths:
-            raise ValueError(f"No files found matching glob patterns {self.glob!r} in {dataset_root}")
+        paths = self._find_paths(Path(dataset_root))
 
         if self.num_workers:
-            with mp.Pool(self.num_workers) as pool:
-                manager = mp.Manager()
-                queue = manager.Queue()
-
-                futures = [
-                    pool.apply_async(
-                        self._collect_items, kwds=dict(path=path, queue=queue)
-                    )
-                    for path in paths
-                ]
+            for batch in self._iter_parallel(paths):
+                yield from batch.to_pylist()
+        else:
+            for path in paths:
+                yield from self.indexer(path)
 
-                remaining = len(paths)
+    def iter_record_batches(self, dataset_root: Path | str) -> Iterator[pa.RecordBatch]:
+        """
+        Indexes dataset partititions in a directory and yields the records as Arrow record batches.
 
-                while remaining > 0:
-                    item = queue.get()
+        Args:
+            dataset_root: The root directory of the dataset.
 
-                    if item is None:
-                        remaining -= 1
-                    else:
-                        yield item
+        Yields:
+            Arrow record batches with the columns 'filename', 'start', 'end' and
+            additional columns prefixed with 'meta_' depending on the enrichers used.
+        """
+        paths = self._find_paths(Path(dataset_root))
 
-                for future in futures:
-                    future.get()
+        if self.num_workers:
+            yield from self._iter_parallel(paths)
         else:
+            builder = self.indexer.create_builder()
+
             for path in paths:
-                yield from self.indexer(path)
+                yield from self.indexer.iter_record_batches(path, builder)
+
+            if len(builder):
+                yield builder.flush()
 
 
 def index_dataset(
@@ -210,9 +650,12 @@ def index_dataset(
     loader: BaseLoader = default_loader,
     glob: str | list[str] = ("*.jsonl", "*.json"),
     num_workers: int | None = None,
+    use_threads: bool = False,
     enrichers: list[Enricher] | None = None,
     progress_bar: bool = True,
-):
+    categorical_columns: Sequence[str] = ("filename",),
+    output_path: PathLike | None = None,
+) -> pl.DataFrame | None:
     """
     Indexes a dataset and returns the index as Polars DataFrame.
 
@@ -223,32 +666,47 @@ def index_dataset(
         max_iter: Maximum number of records to index. Useful for testing. Defaults to None (index all records).
         glob: Glob patterns to match dataset chunk files. Defaults to ['*.jsonl', '*.json'].
         num_workers: The number of worker processes to use for indexing. Defaults to None (no parallelism).
-            It is recommended to not use parallelization at the moment as the overhead may lead
-            to a significant overhead and thus slower indexing than single-threaded processing.
+            Each worker indexes whole files and sends back their record batches, so that the
+            inter-process communication overhead is paid once per file rather than once per record.
+            Workers are spawned rather than forked, so scripts using worker processes have to guard
+            their entry point with `if __name__ == "__main__":`.
+        use_threads: Whether to use worker threads instead of worker processes. Threads only scale for
+            work that runs without the GIL, e.g. on free-threaded Python builds. Defaults to False.
         enrichers: Enrichers to use for indexing. By default, no enrichers will be used.
         progress_bar: Whether to display a progress bar. Defaults to True.
+        categorical_columns: Columns to store as categorical. The encoding is applied while building
+            the index, so no additional pass over the data is required. Defaults to ['filename'].
+        output_path: Path of a Parquet file to write the index to. If provided, record batches are
+            written as soon as they are built instead of collecting the whole index in memory.
+            Defaults to None (return the index as DataFrame).
 
     Returns:
-        A Polars DataFrame representing the index of the dataset.
+        A Polars DataFrame representing the index of the dataset, or None if `output_path` is provided.
     """
     data_root = Path(data_root)
 
     file_indexer = FileIndexer(
         loader=loader,
         batch_size=batch_size,
-        enrichers=enrichers
+        enrichers=enrichers,
+        categorical_columns=categorical_columns,
     )
 
     directory_indexer = DirectoryIndexer(
-        indexer=file_indexer, glob=glob, num_workers=num_workers
+        indexer=file_indexer,
+        glob=glob,
+        num_workers=num_workers,
+        use_threads=use_threads,
     )
 
-    records = directory_indexer(data_root)
-
-    if max_iter:
-        records = islice(records, max_iter)
+    batches = _limit_record_batches(
+        directory_indexer.iter_record_batches(data_root),
+        max_iter=max_iter,
+        progress_bar=progress_bar,
+    )
 
-    if progress_bar:
-        records = tqdm(records)
+    if output_path is not None:
+        write_record_batches(batches, output_path)
+        return None
 
-    return pl.from_dicts(list(records))
+    return pl.from_arrow(concat_record_batches(list(batches)))
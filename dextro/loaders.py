@@ -1,13 +1,200 @@
 import abc
+import functools
 import json
 import csv
+import mmap
+import numpy as np
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 import polars as pl
-from typing import Iterable
-from dextro.types import DatasetRecord, PathLike, FileItem, ItemMeta
+from typing import Callable, Iterable, Iterator
+from dextro.types import Batch, DatasetRecord, PathLike, FileItem
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _loads(content: bytes | memoryview):
+        return json.loads(
+            bytes(content) if isinstance(content, memoryview) else content
+        )
+
+
+# Number of bytes scanned for line breaks at once. Bounds the size of temporary arrays.
+SCAN_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _find_line_offsets_numpy(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    size = len(data)
+
+    newlines = np.concatenate(
+        [np.empty(0, dtype=np.int64)]
+        + [
+            np.flatnonzero(data[offset : offset + SCAN_CHUNK_SIZE] == 0x0A) + offset
+            for offset in range(0, size, SCAN_CHUNK_SIZE)
+        ]
+    )
+
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [size]))
+
+    has_carriage_return = ends > starts
+    has_carriage_return[has_carriage_return] = (
+        data[ends[has_carriage_return] - 1] == 0x0D
+    )
+    ends[has_carriage_return] -= 1
+
+    return starts, ends
+
+
+def _scan_line_offsets(data):
+    size = data.shape[0]
+
+    # First pass: count line breaks to allocate the offsets exactly once
+    num_newlines = 0
+    for i in range(size):
+        if data[i] == 0x0A:
+            num_newlines += 1
+
+    starts = np.empty(num_newlines + 1, dtype=np.int64)
+    ends = np.empty(num_newlines + 1, dtype=np.int64)
+    starts[0] = 0
+    k = 0
+
+    for i in range(size):
+        if data[i] == 0x0A:
+            ends[k] = i
+            starts[k + 1] = i + 1
+            k += 1
+
+    ends[k] = size
+
+    for k in range(num_newlines + 1):
+        if ends[k] > starts[k] and data[ends[k] - 1] == 0x0D:
+            ends[k] -= 1
+
+    return starts, ends
+
+
+@functools.lru_cache(maxsize=None)
+def _find_line_offsets_numba() -> (
+    Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]] | None
+):
+    # Numba is imported on first use rather than with this module, as importing it takes a
+    # noticeable fraction of a second in every process, including spawned indexing workers
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    return njit(cache=True)(_scan_line_offsets)
+
+
+def find_line_offsets(buffer) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the start and end offsets of all lines in a buffer.
+
+    Line breaks are located in a compiled Numba kernel if Numba is installed and
+    with vectorized NumPy comparisons otherwise, both avoiding a Python loop.
+    The end offsets exclude the line break as well as a trailing carriage return.
+
+    Args:
+        buffer: An object supporting the buffer protocol, e.g. a memory map.
+
+    Returns:
+        A tuple of two int64 arrays containing the start and end offsets of each line.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+
+    kernel = _find_line_offsets_numba()
+
+    if kernel is not None:
+        return kernel(data)
+
+    return _find_line_offsets_numpy(data)
+
+
+WHITESPACE_BYTES = np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8)
+
+
+def find_non_blank_lines(buffer, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Determines which lines of a buffer contain other characters than whitespace.
+
+    Only lines that start with whitespace are checked in full, which is rare for
+    serialized records, so the check stays vectorized for the common case.
+
+    Args:
+        buffer: An object supporting the buffer protocol, e.g. a memory map.
+        starts: The start offsets of the lines.
+        ends: The end offsets of the lines.
+
+    Returns:
+        A boolean mask that is True for each non-blank line.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    non_blank = ends > starts
+
+    candidates = np.flatnonzero(non_blank)
+    candidates = candidates[np.isin(data[starts[candidates]], WHITESPACE_BYTES)]
+
+    for index in candidates:
+        non_blank[index] = not np.isin(
+            data[starts[index] : ends[index]], WHITESPACE_BYTES
+        ).all()
+
+    return non_blank
+
+
+@contextmanager
+def open_lines(path: Path) -> Iterator[tuple[memoryview, np.ndarray, np.ndarray]]:
+    """
+    Memory-maps a file and locates its non-blank lines.
+
+    Args:
+        path: The path of the file.
+
+    Yields:
+        A memoryview of the file content and the start and end offsets of its lines
+        that contain other characters than whitespace.
+        The offsets are kept as NumPy arrays, callers convert them to Python ints per batch.
+    """
+    if path.stat().st_size == 0:
+        yield memoryview(b""), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return
+
+    with (
+        open(path, "rb") as fp,
+        mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mem_map,
+        memoryview(mem_map) as view,
+    ):
+        starts, ends = find_line_offsets(view)
+
+        non_blank = find_non_blank_lines(view, starts, ends)
+
+        yield view, starts[non_blank], ends[non_blank]
+
+
+def _load_slice(
+    load_item: Callable[[memoryview], DatasetRecord],
+    view: memoryview,
+    start: int,
+    end: int,
+):
+    # The slice is released explicitly, as a traceback referencing it would otherwise
+    # keep the memory map exported and make closing it fail with a BufferError
+    with view[start:end] as content:
+        return load_item(content)
 
 
 class BaseLoader(abc.ABC):
+    # Whether `load_item` accepts memoryviews in addition to bytes, which allows callers
+    # to pass slices of memory maps without copying them first
+    supports_buffers: bool = False
+
     @abc.abstractmethod
     def load_item(self, content: bytes) -> DatasetRecord:
         pass
@@ -16,96 +203,162 @@ class BaseLoader(abc.ABC):
     def iter_file_items(self, path: PathLike) -> Iterable[FileItem]:
         pass
 
+    def iter_file_batches(
+        self, path: PathLike, batch_size: int, decode: bool = True
+    ) -> Iterator[Batch]:
+        """
+        Iterates over the items of a file in columnar batches.
 
-class JSONLinesLoader(BaseLoader):
-    def load_item(self, content: bytes):
-        return json.loads(content)
-    
-    def iter_file_items(self, path: PathLike) -> Iterable[FileItem]:
+        The default implementation groups the items yielded by `iter_file_items`.
+        Loaders may override this method to fill the batch columns directly.
+
+        Args:
+            path: The path of the file.
+            batch_size: The maximum number of items per batch.
+            decode: Whether the items are needed. If False, loaders may skip deserialization
+                and set the items to None. The default implementation always deserializes.
+
+        Yields:
+            Batches of consecutive items.
+        """
         path = Path(path)
-        
-        with open(path, 'rb') as fp:
-            while True:
-                start = fp.tell()
+        items = iter(self.iter_file_items(path))
 
-                line = fp.readline().strip()
+        while batch := list(islice(items, batch_size)):
+            yield Batch.from_items(path.name, batch)
 
-                if not line:
-                    break
 
-                end = start + len(line)
+class JSONLinesLoader(BaseLoader):
+    supports_buffers = True
+
+    def load_item(self, content: bytes | memoryview):
+        try:
+            return _loads(content)
+        except ValueError:
+            # orjson is stricter than the standard library (e.g. regarding NaN or big integers)
+            return json.loads(bytes(content))
 
-                data = self.load_item(line)
+    def iter_file_items(self, path: PathLike) -> Iterable[FileItem]:
+        for batch in self.iter_file_batches(path, batch_size=1024):
+            yield from batch.to_items()
+
+    def iter_file_batches(
+        self, path: PathLike, batch_size: int, decode: bool = True
+    ) -> Iterator[Batch]:
+        path = Path(path)
+        load_item = self.load_item
 
-                yield FileItem(
-                    meta=ItemMeta(start=start, end=end, filename=path.name),
-                    data=data
+        with open_lines(path) as (view, starts, ends):
+            for offset in range(0, len(starts), batch_size):
+                batch_starts = starts[offset : offset + batch_size].tolist()
+                batch_ends = ends[offset : offset + batch_size].tolist()
+
+                if decode:
+                    data = [
+                        _load_slice(load_item, view, start, end)
+                        for start, end in zip(batch_starts, batch_ends)
+                    ]
+                else:
+                    data = [None] * len(batch_starts)
+
+                yield Batch(
+                    filename=path.name,
+                    starts=batch_starts,
+                    ends=batch_ends,
+                    data=data,
                 )
 
 
 class CSVLoader(BaseLoader):
-    def __init__(self, header: int | None = 0, names: list[str] | None = None, delimiter: str = ',', encoding: str = 'utf8'):
+    supports_buffers = True
+
+    def __init__(
+        self,
+        header: int | None = 0,
+        names: list[str] | None = None,
+        delimiter: str = ",",
+        encoding: str = "utf8",
+    ):
         self.header = header
         self.names = names
         self.delimiter = delimiter
         self.encoding = encoding
-    
-    def load_item(self, content: bytes) -> DatasetRecord:
-        row, *_ =  csv.reader([
-            content.decode(self.encoding)
-        ], delimiter=self.delimiter)
+
+    def _parse_line(self, line: str) -> list[str]:
+        # Splitting is much cheaper than setting up a CSV reader, but only valid without quoted fields
+        if '"' not in line:
+            return line.split(self.delimiter)
+
+        row, *_ = csv.reader([line], delimiter=self.delimiter)
         return row
 
+    def load_item(self, content: bytes | memoryview) -> DatasetRecord:
+        return self._parse_line(str(content, self.encoding))
+
     def iter_file_items(self, path: PathLike) -> Iterable[FileItem]:
-        path = Path(path)
+        for batch in self.iter_file_batches(path, batch_size=1024):
+            yield from batch.to_items()
 
-        names = self.names
-        line_idx = 0
+    def iter_file_batches(
+        self, path: PathLike, batch_size: int, decode: bool = True
+    ) -> Iterator[Batch]:
+        path = Path(path)
+        encoding = self.encoding
+        parse_line = self._parse_line
 
-        with open(path, 'rb') as fp:
-            while True:
-                start = fp.tell()
+        with open_lines(path) as (view, starts, ends):
+            names = self.names
 
-                line = fp.readline().strip()
+            if self.header is not None:
+                if len(starts) <= self.header:
+                    return
 
-                if not line:
-                    break
+                if names is None:
+                    names = _load_slice(
+                        self.load_item,
+                        view,
+                        int(starts[self.header]),
+                        int(ends[self.header]),
+                    )
 
-                end = start + len(line)
+                starts = starts[self.header + 1 :]
+                ends = ends[self.header + 1 :]
 
-                if self.header is not None and names is None:
-                    if line_idx < self.header:
-                        continue
-                    else:
-                        names = self.load_item(line)
-                    
-                    start = end + 1
+            for offset in range(0, len(starts), batch_size):
+                batch_starts = starts[offset : offset + batch_size].tolist()
+                batch_ends = ends[offset : offset + batch_size].tolist()
 
+                if not decode:
+                    yield Batch(
+                        filename=path.name,
+                        starts=batch_starts,
+                        ends=batch_ends,
+                        data=[None] * len(batch_starts),
+                    )
                     continue
 
-                row = self.load_item(line)
+                rows = [
+                    parse_line(str(view[start:end], encoding))
+                    for start, end in zip(batch_starts, batch_ends)
+                ]
 
                 if names is None:
-                    names = [f'col_{i}' for i in range(len(row))]
-                else:
-                    assert len(names) == len(row)
-                
-                record = dict(zip(names, row, strict=True))
+                    names = [f"col_{i}" for i in range(len(rows[0]))]
 
-                yield FileItem(
-                    meta=ItemMeta(start=start, end=end, filename=path.name),
-                    data=record
+                yield Batch(
+                    filename=path.name,
+                    starts=batch_starts,
+                    ends=batch_ends,
+                    data=[dict(zip(names, row, strict=True)) for row in rows],
                 )
 
-                start = end + 1
-
 
 default_loader = JSONLinesLoader()
 
 loader_registry = {
-    'jsonl': lambda: JSONLinesLoader(),
-    'json_lines': lambda: JSONLinesLoader(),
-    'csv': lambda: CSVLoader(delimiter=','),
-    'csv_space_seperated': lambda: CSVLoader(delimiter=' '),
-    'tsv': lambda: CSVLoader(delimiter='\t'),
+    "jsonl": lambda: JSONLinesLoader(),
+    "json_lines": lambda: JSONLinesLoader(),
+    "csv": lambda: CSVLoader(delimiter=","),
+    "csv_space_seperated": lambda: CSVLoader(delimiter=" "),
+    "tsv": lambda: CSVLoader(delimiter="\t"),
 }
@@ -1,5 +1,7 @@
+import functools
 from dataclasses import dataclass, field
-from typing import Any
+from itertools import repeat
+from typing import Any, Callable, Iterator
 from pathlib import Path
 
 
@@ -7,26 +9,117 @@ DatasetRecord = dict[str, Any]
 PathLike = str | Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemMeta:
     start: int
     end: int
     filename: str
-    additional_info: dict[str, Any] = field(default_factory=dict)
+    # Allocated on first use, so that items without additional information don't pay for a dict
+    additional_info: dict[str, Any] | None = None
 
-    def as_dict(self, meta_prefix: str = "meta_"):
-        return {
-            "start": self.start,
-            "end": self.end,
-            "filename": self.filename,
-            **{meta_prefix + k: v for k, v in self.additional_info.items()}
-        }
 
-
-@dataclass
+@dataclass(slots=True)
 class FileItem:
     meta: ItemMeta
     data: DatasetRecord
 
     def add_info(self, key: str, value: Any):
+        if self.meta.additional_info is None:
+            self.meta.additional_info = {}
+
         self.meta.additional_info[key] = value
+
+
+@dataclass(slots=True)
+class Batch:
+    """
+    Columnar representation of consecutive items of a single file.
+
+    Each attribute holds one list entry per item, so that loaders and enrichers can process
+    a batch without allocating per-item objects.
+
+    Args:
+        filename: The name of the file the items originate from.
+        starts: The start offsets of the items in the file.
+        ends: The end offsets of the items in the file.
+        data: The deserialized items. Items are None if the loader was asked to skip deserialization.
+        meta: Additional information per key, added by enrichers.
+    """
+
+    filename: str
+    starts: list[int]
+    ends: list[int]
+    data: list[DatasetRecord | None]
+    meta: dict[str, list[Any]] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add_info(self, key: str, values: list[Any]):
+        self.meta[key] = values
+
+    def to_items(self) -> list[FileItem]:
+        meta_items = list(self.meta.items())
+
+        return [
+            FileItem(
+                meta=ItemMeta(
+                    start=start,
+                    end=end,
+                    filename=self.filename,
+                    additional_info={key: values[i] for key, values in meta_items}
+                    if meta_items
+                    else None,
+                ),
+                data=data,
+            )
+            for i, (start, end, data) in enumerate(
+                zip(self.starts, self.ends, self.data)
+            )
+        ]
+
+    @classmethod
+    def from_items(cls, filename: str, items: list[FileItem]) -> "Batch":
+        meta = {}
+
+        for i, item in enumerate(items):
+            if not item.meta.additional_info:
+                continue
+
+            for key, value in item.meta.additional_info.items():
+                if key not in meta:
+                    meta[key] = [None] * len(items)
+                meta[key][i] = value
+
+        return cls(
+            filename=filename,
+            starts=[item.meta.start for item in items],
+            ends=[item.meta.end for item in items],
+            data=[item.data for item in items],
+            meta=meta,
+        )
+
+    def iter_records(self, meta_prefix: str = "meta_") -> Iterator[DatasetRecord]:
+        keys = ("start", "end", "filename", *(meta_prefix + key for key in self.meta))
+        make_record = _record_factory(keys)
+
+        return map(
+            make_record,
+            self.starts,
+            self.ends,
+            repeat(self.filename),
+            *self.meta.values(),
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _record_factory(keys: tuple[str, ...]) -> Callable[..., DatasetRecord]:
+    """
+    Generates a function building a record with the given keys from positional values.
+
+    The set of keys is fixed for a given enricher configuration, so the function is generated once
+    and builds each record with a single dict literal instead of merging per-record dicts.
+    """
+    args = ", ".join(f"v{i}" for i in range(len(keys)))
+    items = ", ".join(f"{key!r}: v{i}" for i, key in enumerate(keys))
+    return eval(f"lambda {args}: {{{items}}}")
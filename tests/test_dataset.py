@@ -1,3 +1,7 @@
+import gc
+import weakref
+import polars as pl
+
 from .conftest import NUM_PARTITIONS, NUM_RECORDS_PER_PARTITION
 from dextro.dataset import IndexedDataset
 
@@ -11,3 +15,39 @@ def test_indexed_dataset(indexed_dataset):
         item = dataset[i]
         assert isinstance(item, dict)
         assert 'text' in item
+
+
+def test_indexed_dataset_getitems(indexed_dataset):
+    dataset = IndexedDataset(indexed_dataset)
+    indices = [7, 0, 12, 3, 3]
+
+    assert dataset.__getitems__(indices) == [dataset[i] for i in indices]
+
+
+def test_indexed_dataset_filter(indexed_dataset):
+    dataset = IndexedDataset(indexed_dataset, index_filter=pl.col("filename") == "part_001.jsonl")
+
+    assert len(dataset) == NUM_RECORDS_PER_PARTITION
+    assert dataset.filenames == ["part_001.jsonl"]
+
+
+def test_indexed_dataset_pread_backend(indexed_dataset):
+    mmap_dataset = IndexedDataset(indexed_dataset)
+    pread_dataset = IndexedDataset(indexed_dataset, backend="pread")
+
+    for i in range(len(mmap_dataset)):
+        assert pread_dataset[i] == mmap_dataset[i]
+
+    assert pread_dataset.__getitems__([4, 1]) == [mmap_dataset[4], mmap_dataset[1]]
+
+
+def test_indexed_dataset_closes_files_when_collected(indexed_dataset):
+    dataset = IndexedDataset(indexed_dataset)
+    mem_maps = list(dataset.mem_maps.values())
+    dataset_ref = weakref.ref(dataset)
+
+    del dataset
+    gc.collect()
+
+    assert dataset_ref() is None
+    assert all(mem_map.closed for mem_map in mem_maps)
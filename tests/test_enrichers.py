@@ -1,4 +1,4 @@
-from dextro.enrichers import TextLength, LanguageDetectionEnricher
+from dextro.enrichers import ByteLength, TextLength, LanguageDetectionEnricher
 from lingua import Language
 
 
@@ -19,3 +19,39 @@ def test_language_detection_enricher(file_item_batch):
         item_meta = file_item.meta
         assert "language" in item_meta.additional_info
         assert item_meta.additional_info["language"] == "LA"
+
+
+def test_text_length_enricher_batch(file_item_batch):
+    enricher = TextLength()
+    file_item_batch = enricher.enrich_batch(file_item_batch)
+
+    for file_item in file_item_batch:
+        assert file_item.meta.additional_info["text_length"] == len(
+            file_item.data["text"]
+        )
+
+
+def test_byte_length_enricher(file_item):
+    enricher = ByteLength()
+    file_item = enricher.enrich_item(file_item)
+
+    assert file_item.meta.additional_info["byte_length"] == 10
+
+
+def test_language_detection_enricher_shares_detector():
+    languages = [Language.ENGLISH, Language.LATIN]
+
+    first = LanguageDetectionEnricher(languages=languages)
+    second = LanguageDetectionEnricher(languages=list(reversed(languages)))
+
+    assert first.detector is second.detector
+
+
+def test_language_detection_enricher_multiple(file_item_batch):
+    enricher = LanguageDetectionEnricher(
+        languages=[Language.ENGLISH, Language.LATIN], detect_multiple=True
+    )
+    file_item_batch = enricher.enrich_batch(file_item_batch)
+
+    for file_item in file_item_batch:
+        assert file_item.meta.additional_info["language"] == "LA"
@@ -1,4 +1,24 @@
-from dextro.indexing import FileIndexer, DirectoryIndexer, index_dataset
+import pytest
+import polars as pl
+import pyarrow as pa
+
+from lingua import Language
+from dextro.enrichers import (
+    BaseEnricher,
+    BaseBatchedEnricher,
+    ByteLength,
+    LanguageDetectionEnricher,
+    TextLength,
+)
+from dextro.indexing import (
+    FileIndexer,
+    DirectoryIndexer,
+    RecordBatchBuilder,
+    concat_record_batches,
+    index_dataset,
+    write_record_batches,
+)
+from dextro.types import Batch
 from .conftest import NUM_PARTITIONS, NUM_RECORDS_PER_PARTITION
 
 
@@ -26,3 +46,207 @@ def test_dataset_indexing(dataset_root):
     assert "filename" in index_df.columns
     assert "start" in index_df.columns
     assert "end" in index_df.columns
+
+
+def test_dataset_indexing_with_enrichers(dataset_root):
+    index_df = index_dataset(
+        data_root=dataset_root,
+        enrichers=[TextLength()],
+        categorical_columns=["filename"],
+        progress_bar=False,
+    )
+
+    assert len(index_df) == NUM_PARTITIONS * NUM_RECORDS_PER_PARTITION
+    assert index_df["filename"].dtype == pl.Categorical
+    assert index_df["start"].dtype == pl.Int64
+    assert index_df["meta_text_length"].min() > 0
+
+
+def test_dataset_indexing_max_iter(dataset_root):
+    index_df = index_dataset(data_root=dataset_root, max_iter=7, progress_bar=False)
+
+    assert len(index_df) == 7
+
+
+class ShortTextFilter(BaseEnricher):
+    def enrich_item(self, item):
+        if len(item.data["text"]) < 40:
+            item.add_info("is_short", True)
+            return item
+        return None
+
+
+def test_file_indexer_item_enricher(dataset_root):
+    file_indexer = FileIndexer(enrichers=[ShortTextFilter(), TextLength()])
+
+    records = list(file_indexer(dataset_root / "part_000.jsonl"))
+
+    assert len(records) <= NUM_RECORDS_PER_PARTITION
+
+    for record in records:
+        assert record["meta_is_short"]
+        assert record["meta_text_length"] < 40
+
+
+class UpperCaseBatch(BaseBatchedEnricher):
+    def enrich_batch(self, items):
+        for item in items:
+            item.add_info("upper", item.data["text"].upper())
+        return items
+
+
+def test_file_indexer_read_size():
+    assert (
+        FileIndexer(batch_size=4, enrichers=[TextLength()]).read_size
+        == FileIndexer.MIN_READ_SIZE
+    )
+    assert (
+        FileIndexer(batch_size=4, enrichers=[TextLength(), UpperCaseBatch()]).read_size
+        == 4
+    )
+
+
+def test_dataset_indexing_to_parquet(dataset_root):
+    output_path = dataset_root / "index.parquet"
+
+    result = index_dataset(
+        data_root=dataset_root,
+        enrichers=[TextLength()],
+        progress_bar=False,
+        output_path=output_path,
+    )
+    index_df = pl.read_parquet(output_path)
+
+    assert result is None
+    assert len(index_df) == NUM_PARTITIONS * NUM_RECORDS_PER_PARTITION
+    assert index_df["filename"].dtype == pl.Categorical
+    assert "meta_text_length" in index_df.columns
+
+
+def test_file_indexer_skips_decoding(tmp_path):
+    path = tmp_path / "part.jsonl"
+    path.write_text("not json\n{also not json\n")
+
+    records = list(FileIndexer(enrichers=[ByteLength()])(path))
+
+    assert [record["meta_byte_length"] for record in records] == [8, 14]
+
+
+def test_dataset_indexing_with_threads(dataset_root):
+    index_df = index_dataset(
+        data_root=dataset_root,
+        num_workers=2,
+        use_threads=True,
+        enrichers=[TextLength()],
+        progress_bar=False,
+    )
+    serial_index_df = index_dataset(
+        data_root=dataset_root, enrichers=[TextLength()], progress_bar=False
+    )
+
+    assert index_df.equals(serial_index_df)
+
+
+def test_dataset_indexing_language_detection_parallel(dataset_root):
+    enricher = LanguageDetectionEnricher(languages=[Language.ENGLISH, Language.LATIN])
+
+    serial_index_df = index_dataset(
+        data_root=dataset_root, batch_size=4, enrichers=[enricher], progress_bar=False
+    )
+    parallel_index_df = index_dataset(
+        data_root=dataset_root,
+        batch_size=4,
+        enrichers=[enricher],
+        num_workers=2,
+        progress_bar=False,
+    )
+
+    assert parallel_index_df.equals(serial_index_df)
+
+
+@pytest.mark.parametrize("max_pending_batches", [1, 16])
+def test_write_record_batches_schema_evolution(tmp_path, max_pending_batches):
+    output_path = tmp_path / "index.parquet"
+    batches = [
+        pa.RecordBatch.from_pydict({"offset": [0, 10], "meta_lang": pa.nulls(2)}),
+        pa.RecordBatch.from_pydict({"offset": [20], "meta_lang": ["en"]}),
+        pa.RecordBatch.from_pydict(
+            {"offset": [30], "meta_lang": ["de"], "meta_score": [0.5]}
+        ),
+    ]
+
+    write_record_batches(batches, output_path, max_pending_batches=max_pending_batches)
+    index_df = pl.read_parquet(output_path)
+
+    assert index_df["offset"].to_list() == [0, 10, 20, 30]
+    assert index_df["meta_lang"].to_list() == [None, None, "en", "de"]
+    assert index_df["meta_score"].to_list() == [None, None, None, 0.5]
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+@pytest.mark.parametrize("max_pending_batches", [1, 16])
+def test_write_record_batches_numeric_promotion(tmp_path, max_pending_batches):
+    output_path = tmp_path / "index.parquet"
+    batches = [
+        pa.RecordBatch.from_pydict({"meta_score": [1, 2]}),
+        pa.RecordBatch.from_pydict({"meta_score": [2.0]}),
+        pa.RecordBatch.from_pydict({"meta_score": [0.5]}),
+    ]
+
+    write_record_batches(batches, output_path, max_pending_batches=max_pending_batches)
+    index_df = pl.read_parquet(output_path)
+
+    assert index_df["meta_score"].dtype == pl.Float64
+    assert index_df["meta_score"].to_list() == [1.0, 2.0, 2.0, 0.5]
+    assert (
+        concat_record_batches(batches).schema.field("meta_score").type == pa.float64()
+    )
+
+
+class FileScore(BaseEnricher):
+    def enrich_item(self, item):
+        item.add_info("score", 1 if item.meta.filename == "part_000.jsonl" else 0.5)
+        return item
+
+
+@pytest.mark.parametrize("to_parquet", [False, True])
+def test_dataset_indexing_mixed_numeric_types(dataset_root, tmp_path, to_parquet):
+    output_path = tmp_path / "index.parquet" if to_parquet else None
+
+    index_df = index_dataset(
+        data_root=dataset_root,
+        num_workers=NUM_PARTITIONS,
+        use_threads=True,
+        enrichers=[FileScore()],
+        progress_bar=False,
+        output_path=output_path,
+    )
+
+    if to_parquet:
+        index_df = pl.read_parquet(output_path)
+
+    assert index_df["meta_score"].dtype == pl.Float64
+    assert len(index_df) == NUM_PARTITIONS * NUM_RECORDS_PER_PARTITION
+
+
+def test_directory_indexer_flushes_before_overflow(dataset_root):
+    file_indexer = FileIndexer(batch_size=2, enrichers=[UpperCaseBatch()], flush_size=4)
+
+    batches = list(
+        DirectoryIndexer(indexer=file_indexer).iter_record_batches(dataset_root)
+    )
+
+    assert all(batch.num_rows <= 4 for batch in batches)
+    assert (
+        sum(batch.num_rows for batch in batches)
+        == NUM_PARTITIONS * NUM_RECORDS_PER_PARTITION
+    )
+
+
+def test_record_batch_builder_grows_for_large_batch():
+    builder = RecordBatchBuilder(flush_size=2)
+    builder.append_batch(Batch("part.jsonl", [0, 4, 8], [3, 7, 11], [None] * 3))
+
+    assert builder.is_full
+    assert builder.flush().column("start").to_pylist() == [0, 4, 8]
+    assert len(builder.starts) == 2
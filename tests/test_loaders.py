@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from dextro.loaders import (
+    CSVLoader,
+    JSONLinesLoader,
+    _find_line_offsets_numba,
+    _find_line_offsets_numpy,
+)
+
+
+def test_jsonl_loader_offsets(tmp_path):
+    path = tmp_path / "part.jsonl"
+    path.write_bytes(b'{"text": "a"}\r\n\n{"text": "bc"}\n')
+
+    items = list(JSONLinesLoader().iter_file_items(path))
+    content = path.read_bytes()
+
+    assert [item.data["text"] for item in items] == ["a", "bc"]
+
+    for item in items:
+        assert (
+            JSONLinesLoader().load_item(content[item.meta.start : item.meta.end])
+            == item.data
+        )
+
+
+def test_jsonl_loader_batches(tmp_path):
+    path = tmp_path / "part.jsonl"
+    path.write_bytes(b"\n".join(b'{"text": "%d"}' % i for i in range(5)))
+
+    batches = list(JSONLinesLoader().iter_file_batches(path, batch_size=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [data["text"] for batch in batches for data in batch.data] == list("01234")
+    assert all(batch.filename == "part.jsonl" for batch in batches)
+
+
+def test_csv_loader(tmp_path):
+    path = tmp_path / "part.csv"
+    path.write_bytes(b'id,text\r\n1,plain\r\n2,"quoted, with delimiter"\r\n')
+
+    items = list(CSVLoader().iter_file_items(path))
+    content = path.read_bytes()
+
+    assert [item.data for item in items] == [
+        {"id": "1", "text": "plain"},
+        {"id": "2", "text": "quoted, with delimiter"},
+    ]
+    assert CSVLoader().load_item(content[items[1].meta.start : items[1].meta.end]) == [
+        "2",
+        "quoted, with delimiter",
+    ]
+
+
+def test_csv_loader_without_header(tmp_path):
+    path = tmp_path / "part.tsv"
+    path.write_bytes(b"a\tb\nc\td\n")
+
+    items = list(CSVLoader(header=None, delimiter="\t").iter_file_items(path))
+
+    assert [item.data for item in items] == [
+        {"col_0": "a", "col_1": "b"},
+        {"col_0": "c", "col_1": "d"},
+    ]
+
+
+def test_find_line_offsets_numba():
+    pytest.importorskip("numba")
+
+    data = np.frombuffer(b'{"a": 1}\r\n\n{"b": 2}\r\n{"c": 3}', dtype=np.uint8)
+
+    numba_starts, numba_ends = _find_line_offsets_numba()(data)
+    numpy_starts, numpy_ends = _find_line_offsets_numpy(data)
+
+    assert numba_starts.tolist() == numpy_starts.tolist() == [0, 10, 11, 21]
+    assert numba_ends.tolist() == numpy_ends.tolist() == [8, 10, 19, 29]
+
+
+def test_jsonl_loader_malformed_line(tmp_path):
+    path = tmp_path / "part.jsonl"
+    path.write_bytes(b'{"text": "a"}\n{bad json\n')
+
+    with pytest.raises(ValueError):
+        list(JSONLinesLoader().iter_file_items(path))
+
+
+def test_csv_loader_malformed_header(tmp_path):
+    path = tmp_path / "part.csv"
+    path.write_bytes(b"a,\xff\n1,2\n")
+
+    with pytest.raises(ValueError):
+        list(CSVLoader().iter_file_items(path))
+
+
+def test_jsonl_loader_skips_blank_lines(tmp_path):
+    path = tmp_path / "part.jsonl"
+    path.write_bytes(b'{"text": "a"}\n  \t\r\n \n {"text": "b"}\n\x0c')
+
+    batches = list(
+        JSONLinesLoader().iter_file_batches(path, batch_size=8, decode=False)
+    )
+
+    assert [(batch.starts, batch.ends) for batch in batches] == [([0, 21], [13, 35])]